@@ -84,7 +84,12 @@ uint16_t TMR1_PeriodGet(void);
 
 uint16_t TMR1_CounterGet(void);
 
-uint32_t TMR1_FrequencyGet(void);
+/* Timer clock is fixed at configuration time, so the getter collapses to a
+   constant at every call site instead of paying a call into plib_tmr1.c */
+__STATIC_FORCEINLINE uint32_t TMR1_FrequencyGet(void)
+{
+    return (6250000U);
+}
 
 void TMR1_InterruptEnable(void);
 
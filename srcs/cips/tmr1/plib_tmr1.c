@@ -109,17 +109,14 @@ uint16_t TMR1_CounterGet(void)
     return((uint16_t)TMR1);
 }
 
-uint32_t TMR1_FrequencyGet(void)
-{
-    return (6250000);
-}
-
 void __attribute__((used)) TIMER_1_InterruptHandler (void)
 {
     uint32_t status = IFS0bits.T1IF;
     IFS0CLR = _IFS0_T1IF_MASK;
 
-    if((tmr1Obj.callback_fn != NULL))
+    /* A registered callback is the expected case once the timer is running;
+       bias the branch so the interrupt hot path falls through to it */
+    if(__builtin_expect((tmr1Obj.callback_fn != NULL), 1))
     {
         uintptr_t context = tmr1Obj.context;
         tmr1Obj.callback_fn(status, context);
@@ -72,6 +72,10 @@ int main ( void )
       last_toggle = millisec;
     }
 
+    /* Nothing to do until the next TMR1 tick updates millisec, so idle the
+       CPU instead of busy-spinning (WAIT resumes on any enabled interrupt) */
+    _wait();
+
   }
 
     /* Execution should not come here during normal operation */